@@ -7,17 +7,21 @@ Use the space bar or up arrow to flap the bird. Press escape to quit.
 """
 from __future__ import annotations
 
+import functools
 import math
 import os
-import random
 import sys
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from random import randint, uniform
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 import pygame
 
 pygame.init()
-screen = pygame.display.set_mode((288, 512))
+# Every cached sprite below is converted to the display's pixel format so blits
+# take SDL's fast same-format path; they must therefore be built after set_mode.
+screen = pygame.display.set_mode((288, 512), pygame.SCALED | pygame.DOUBLEBUF)
 clock = pygame.time.Clock()
 
 BASE_PATH = os.path.dirname(__file__)
@@ -28,11 +32,15 @@ down_flap = pygame.image.load(os.path.join(BASE_PATH, "yellowbird-downflap.png")
 bird_frames = [mid_flap, down_flap, up_flap]
 bird_index = 0
 bird_surface = bird_frames[bird_index]
-bird_rect = bird_surface.get_rect(center=(100, 300))
 
 # Constants --------------------------------------------------------------------
 WIDTH, HEIGHT = 288, 512
 FPS = 60
+# Elapsed time is counted in units of 1/FPS ms, so one simulation step is a
+# whole number of them and the accumulator never picks up rounding error.
+STEP_TIME = 1000
+STEP_SNAP = FPS  # frames within 1 ms of one step count as exactly one step
+MAX_STEPS_PER_FRAME = 5
 PIPE_GAP = 160
 PIPE_WIDTH = 70
 PIPE_SPEED = 3
@@ -46,12 +54,19 @@ BACKGROUND_COLOR = (135, 206, 235)  # sky blue
 BIRD_FLAP_INTERVAL_MS = 120
 BIRD_FLAP_EVENT = pygame.USEREVENT + 1
 CLOUD_SIZE_SCALE = 1.7
+PIPE_RIM_HEIGHT = 20
+PIPE_RIM_OVERHANG = 6  # rim sticks out this far on either side of the pipe body
+PIPE_OUTLINE_WIDTH = 3
+BIRD_MIN_ANGLE = -25
+BIRD_MAX_ANGLE = 90
 
 
 JUMP_SOUND: Optional[pygame.mixer.Sound] = None
 HIT_SOUND: Optional[pygame.mixer.Sound] = None
 
 BIRD_RADIUS = math.ceil(max(bird_surface.get_width(), bird_surface.get_height()) / 2)
+BIRD_HALF_WIDTH = bird_surface.get_width() / 2
+BIRD_HALF_HEIGHT = bird_surface.get_height() / 2
 
 
 @dataclass
@@ -64,6 +79,7 @@ class Bird:
     angle: float = 0.0
     alive: bool = True
     frame_index: int = 0
+    jump_sound: Optional[pygame.mixer.Sound] = None
     bird_rect: pygame.Rect = field(init=False)
 
     def __post_init__(self) -> None:
@@ -72,19 +88,23 @@ class Bird:
     def flap(self) -> None:
         if self.alive:
             self.velocity = FLAP_STRENGTH
-            if JUMP_SOUND:
-                JUMP_SOUND.play()
-
-    def update(self) -> None:
-        self.velocity += GRAVITY
+            if self.jump_sound:
+                self.jump_sound.play()
+
+    def update(
+        self,
+        gravity: float = GRAVITY,
+        min_angle: int = BIRD_MIN_ANGLE,
+        max_angle: int = BIRD_MAX_ANGLE,
+    ) -> None:
+        self.velocity += gravity
         self.y += self.velocity
         # limit fall speed to keep gameplay manageable
         self.velocity = min(self.velocity, 10)
-        # Tilt bird based on movement
-        if self.velocity < 0:
-            self.angle = max(-25, self.angle - 5)
-        else:
-            self.angle = min(90, self.angle + 3)
+        # Tilt bird based on movement: nose up 5 degrees a step while rising,
+        # down 3 while falling (bools are ints, so no branch is needed).
+        angle = self.angle + 3 - 8 * (self.velocity < 0)
+        self.angle = min_angle if angle < min_angle else max_angle if angle > max_angle else angle
 
         self.bird_rect.center = (int(self.x), int(self.y))
 
@@ -96,69 +116,92 @@ class Bird:
         self.frame_index = bird_index
         bird_surface = bird_frames[bird_index]
 
-    def rect(self) -> pygame.Rect:
-        return self.bird_rect.copy()
-
     def draw(self, surface: pygame.Surface) -> None:
-        global bird_surface
-        bird_surface = bird_frames[self.frame_index]
-        self.bird_rect.center = (int(self.x), int(self.y))
-        surface.blit(bird_surface, self.bird_rect)
+        # bird_rect is kept centred by update(), so drawing is a single blit.
+        surface.blit(bird_frames[self.frame_index], self.bird_rect)
 
 
-@dataclass
-class Pipe:
-    """A pair of top and bottom pipes."""
+def draw_pipe_half(surface: pygame.Surface, rect: pygame.Rect, rim: pygame.Rect) -> None:
+    body_color = (76, 187, 23)
+    shade_color = (56, 145, 18)
+    highlight_color = (140, 227, 96)
+    rim_color = (96, 207, 43)
 
-    x: float
-    gap_y: float
-    passed: bool = False
+    pygame.draw.rect(surface, body_color, rect)
+    pygame.draw.rect(surface, shade_color, pygame.Rect(rect.x + rect.width - 14, rect.y, 14, rect.height))
+    pygame.draw.rect(surface, highlight_color, pygame.Rect(rect.x + 6, rect.y, 8, rect.height))
+    pygame.draw.rect(surface, rim_color, rim)
+    pygame.draw.rect(surface, shade_color, rim, 3, border_radius=4)
+    pygame.draw.rect(surface, shade_color, rect, PIPE_OUTLINE_WIDTH, border_radius=2)
 
-    def top_rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), 0, PIPE_WIDTH, int(self.gap_y - PIPE_GAP / 2))
 
-    def bottom_rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.gap_y + PIPE_GAP / 2), PIPE_WIDTH, HEIGHT - BASE_HEIGHT - int(self.gap_y + PIPE_GAP / 2))
+def create_pipe_surfaces() -> Tuple[pygame.Surface, pygame.Surface]:
+    """Pre-render full-height top and bottom pipe halves.
 
-    def update(self) -> None:
-        self.x -= PIPE_SPEED
+    The top half carries its rim at the bottom edge and the bottom half at the
+    top edge, so Pipe.draw can show either at any height by cropping.
+    """
+    width = PIPE_WIDTH + 2 * PIPE_RIM_OVERHANG
+    height = HEIGHT - BASE_HEIGHT
+    body = pygame.Rect(PIPE_RIM_OVERHANG, 0, PIPE_WIDTH, height)
 
-    def is_offscreen(self) -> bool:
-        return self.x + PIPE_WIDTH < 0
+    top = pygame.Surface((width, height), pygame.SRCALPHA)
+    draw_pipe_half(top, body, pygame.Rect(0, height - PIPE_RIM_HEIGHT, width, PIPE_RIM_HEIGHT))
+    bottom = pygame.Surface((width, height), pygame.SRCALPHA)
+    draw_pipe_half(bottom, body, pygame.Rect(0, 0, width, PIPE_RIM_HEIGHT))
+    return top.convert_alpha(), bottom.convert_alpha()
 
-    def draw(self, surface: pygame.Surface) -> None:
-        body_color = (76, 187, 23)
-        shade_color = (56, 145, 18)
-        highlight_color = (140, 227, 96)
-        rim_color = (96, 207, 43)
-        rim_height = 20
 
-        top_rect = self.top_rect()
-        bottom_rect = self.bottom_rect()
+pipe_top_surface, pipe_bottom_surface = create_pipe_surfaces()
+# Cropping a half leaves out its far-end outline; these rows are blitted back on.
+pipe_top_cap = pygame.Rect(0, 0, pipe_top_surface.get_width(), PIPE_OUTLINE_WIDTH)
+pipe_bottom_cap = pygame.Rect(0, pipe_bottom_surface.get_height() - PIPE_OUTLINE_WIDTH, pipe_bottom_surface.get_width(), PIPE_OUTLINE_WIDTH)
 
-        pygame.draw.rect(surface, body_color, top_rect)
-        pygame.draw.rect(surface, body_color, bottom_rect)
 
-        top_shade = pygame.Rect(top_rect.x + top_rect.width - 14, top_rect.y, 14, top_rect.height)
-        bottom_shade = pygame.Rect(bottom_rect.x + bottom_rect.width - 14, bottom_rect.y, 14, bottom_rect.height)
-        pygame.draw.rect(surface, shade_color, top_shade)
-        pygame.draw.rect(surface, shade_color, bottom_shade)
+@dataclass
+class Pipe:
+    """A pair of top and bottom pipes."""
 
-        top_highlight = pygame.Rect(top_rect.x + 6, top_rect.y, 8, top_rect.height)
-        bottom_highlight = pygame.Rect(bottom_rect.x + 6, bottom_rect.y, 8, bottom_rect.height)
-        pygame.draw.rect(surface, highlight_color, top_highlight)
-        pygame.draw.rect(surface, highlight_color, bottom_highlight)
+    x: float
+    gap_y: float
+    passed: bool = False
+    top_height: int = field(init=False)
+    bottom_y: int = field(init=False)
+    bottom_height: int = field(init=False)
+    top_bounds: pygame.Rect = field(init=False)
+    bottom_bounds: pygame.Rect = field(init=False)
+    top_area: pygame.Rect = field(init=False)
+    bottom_area: pygame.Rect = field(init=False)
 
-        top_rim = pygame.Rect(top_rect.x - 6, top_rect.bottom - rim_height, PIPE_WIDTH + 12, rim_height)
-        bottom_rim = pygame.Rect(bottom_rect.x - 6, bottom_rect.y, PIPE_WIDTH + 12, rim_height)
-        pygame.draw.rect(surface, rim_color, top_rim)
-        pygame.draw.rect(surface, rim_color, bottom_rim)
+    def __post_init__(self) -> None:
+        # gap_y is fixed for the pipe's lifetime, so the heights, rects and crop
+        # areas are worked out once; update() only shifts the rects' x.
+        self.top_height = int(self.gap_y - PIPE_GAP / 2)
+        self.bottom_y = int(self.gap_y + PIPE_GAP / 2)
+        self.bottom_height = HEIGHT - BASE_HEIGHT - self.bottom_y
+        self.top_bounds = pygame.Rect(int(self.x), 0, PIPE_WIDTH, self.top_height)
+        self.bottom_bounds = pygame.Rect(int(self.x), self.bottom_y, PIPE_WIDTH, self.bottom_height)
+        # The cached halves are cropped so the rim stays at the gap.
+        width, full_height = pipe_top_surface.get_size()
+        self.top_area = pygame.Rect(0, full_height - self.top_height, width, self.top_height)
+        self.bottom_area = pygame.Rect(0, 0, width, self.bottom_height)
+
+    def update(self, speed: int = PIPE_SPEED) -> None:
+        self.x -= speed
+        self.top_bounds.x = self.bottom_bounds.x = int(self.x)
 
-        pygame.draw.rect(surface, shade_color, top_rim, 3, border_radius=4)
-        pygame.draw.rect(surface, shade_color, bottom_rim, 3, border_radius=4)
+    def is_offscreen(self) -> bool:
+        return self.x + PIPE_WIDTH < 0
 
-        pygame.draw.rect(surface, shade_color, top_rect, 3, border_radius=2)
-        pygame.draw.rect(surface, shade_color, bottom_rect, 3, border_radius=2)
+    def render(self) -> Tuple[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect], ...]:
+        """Return the (image, position, area) blits that draw this pipe."""
+        x = self.top_bounds.x - PIPE_RIM_OVERHANG
+        return (
+            (pipe_top_surface, (x, 0), self.top_area),
+            (pipe_top_surface, (x, 0), pipe_top_cap),
+            (pipe_bottom_surface, (x, self.bottom_y), self.bottom_area),
+            (pipe_bottom_surface, (x, self.bottom_bounds.bottom - PIPE_OUTLINE_WIDTH), pipe_bottom_cap),
+        )
 
 
 class Base:
@@ -166,46 +209,39 @@ class Base:
 
     def __init__(self, y: int) -> None:
         self.y = y
-        self.x1 = 0
-        self.x2 = WIDTH
+        self.offset = 0  # how far the tiles have scrolled left, in [0, WIDTH)
         self.speed = PIPE_SPEED
+        # Two screen widths wide, so any scroll offset is covered by one blit.
+        self.tile = pygame.Surface((WIDTH * 2, BASE_HEIGHT)).convert()
+        self.tile.fill((222, 184, 135))
+        pygame.draw.rect(self.tile, (139, 69, 19), pygame.Rect(0, 0, WIDTH * 2, 8))
 
     def update(self) -> None:
-        self.x1 -= self.speed
-        self.x2 -= self.speed
-        if self.x1 + WIDTH < 0:
-            self.x1 = self.x2 + WIDTH
-        if self.x2 + WIDTH < 0:
-            self.x2 = self.x1 + WIDTH
+        self.offset = (self.offset + self.speed) % WIDTH
 
     def draw(self, surface: pygame.Surface) -> None:
-        color = (222, 184, 135)
-        pygame.draw.rect(surface, color, pygame.Rect(int(self.x1), self.y, WIDTH, BASE_HEIGHT))
-        pygame.draw.rect(surface, color, pygame.Rect(int(self.x2), self.y, WIDTH, BASE_HEIGHT))
-        pygame.draw.rect(surface, (139, 69, 19), pygame.Rect(0, self.y, WIDTH, 8))
+        surface.blit(self.tile, (-self.offset, self.y))
 
 
 @dataclass
 class Cloud:
     """Soft, layered cloud that scrolls slowly across the sky."""
 
-    x: float
-    y: float
+    x: int
+    y: int
     base_radius: float
-    speed: float
+    # Speed in pixels per step as the fraction speed_num / speed_den (< 1), so
+    # positions stay whole pixels and never need float maths or int() on draw.
+    speed_num: int
+    speed_den: int
     offsets: List[Tuple[float, float, float, float]]
+    progress: int = 0
+    surface: pygame.Surface = field(init=False)
+    half_width: int = field(init=False)
+    half_height: int = field(init=False)
 
-    @property
-    def width(self) -> float:
-        return self.base_radius * 4.5
-
-    def update(self) -> None:
-        self.x -= self.speed
-        if self.x < -self.width:
-            self.x = WIDTH + random.uniform(20, 120)
-            self.y = random.uniform(40, 240)
-
-    def draw(self, surface: pygame.Surface) -> None:
+    def __post_init__(self) -> None:
+        # The cloud's shape never changes, so its pixels are rasterised once.
         cloud_surface_width = int(self.base_radius * 4.6)
         cloud_surface_height = int(self.base_radius * 2.9)
         cloud_surface = pygame.Surface((cloud_surface_width, cloud_surface_height), pygame.SRCALPHA)
@@ -223,10 +259,29 @@ class Cloud:
             if inner.width > 0 and inner.height > 0:
                 pygame.draw.ellipse(cloud_surface, accent_color, inner)
 
-        surface.blit(
-            cloud_surface,
-            (int(self.x - cloud_surface_width / 2), int(self.y - cloud_surface_height / 2)),
-        )
+        self.surface = cloud_surface.convert_alpha()
+        self.half_width = center_x
+        self.half_height = center_y
+
+    @property
+    def width(self) -> float:
+        return self.base_radius * 4.5
+
+    def update(self) -> bool:
+        """Scroll the cloud; returns True if it moved to a new pixel."""
+        self.progress += self.speed_num
+        if self.progress < self.speed_den:
+            return False
+        self.progress -= self.speed_den
+        self.x -= 1
+        if self.x < -self.width:
+            self.x = WIDTH + randint(20, 120)
+            self.y = randint(40, 240)
+        return True
+
+    def render(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Return the cloud image and the top-left position to blit it at."""
+        return self.surface, (self.x - self.half_width, self.y - self.half_height)
 
 
 CLOUDS: List[Cloud] = []
@@ -236,10 +291,10 @@ def create_cloud_offsets(base_radius: float) -> List[Tuple[float, float, float,
     offsets: List[Tuple[float, float, float, float]] = []
     centers = (-0.75, 0.0, 0.75)
     for index, factor in enumerate(centers):
-        dx = factor * base_radius + random.uniform(-8, 8)
-        dy = random.uniform(-8, 8)
-        width = base_radius * random.uniform(1.4, 1.8) if index == 1 else base_radius * random.uniform(1.1, 1.5)
-        height = base_radius * random.uniform(0.65, 0.9)
+        dx = factor * base_radius + uniform(-8, 8)
+        dy = uniform(-8, 8)
+        width = base_radius * uniform(1.4, 1.8) if index == 1 else base_radius * uniform(1.1, 1.5)
+        height = base_radius * uniform(0.65, 0.9)
         offsets.append((dx, dy, width, height))
     return offsets
 
@@ -248,52 +303,180 @@ def initialize_clouds() -> None:
     if CLOUDS:
         return
     layers = (
-        (0.25, 56.0, 60),
-        (0.4, 48.0, 110),
-        (0.65, 36.0, 160),
+        ((1, 4), 56.0, 60),
+        ((2, 5), 48.0, 110),
+        ((13, 20), 36.0, 160),
     )
-    for speed, base_radius, base_y in layers:
+    for (speed_num, speed_den), base_radius, base_y in layers:
         for _ in range(3):
-            radius = random.uniform(base_radius * 0.85, base_radius * 1.15) * CLOUD_SIZE_SCALE
-            x = random.uniform(0, WIDTH)
-            y = random.uniform(base_y - 20, base_y + 40)
+            radius = uniform(base_radius * 0.85, base_radius * 1.15) * CLOUD_SIZE_SCALE
+            x = randint(0, WIDTH)
+            y = randint(base_y - 20, base_y + 40)
             offsets = create_cloud_offsets(radius)
-            CLOUDS.append(Cloud(x=x, y=y, base_radius=radius, speed=speed, offsets=offsets))
+            CLOUDS.append(Cloud(x=x, y=y, base_radius=radius, speed_num=speed_num, speed_den=speed_den, offsets=offsets))
+
+
+class Sky:
+    """Sky colour and scrolling clouds.
+
+    The slowest clouds are the farthest layer, drawn first, and only move a
+    pixel every few steps. They are composed onto the sky colour in a cached
+    backdrop that is redrawn only when one of them moves; the faster layers are
+    blitted over it every frame.
+    """
+
+    def __init__(self, clouds: List[Cloud]) -> None:
+        slowest = min(cloud.speed_num / cloud.speed_den for cloud in clouds)
+        self.far_clouds = [cloud for cloud in clouds if cloud.speed_num / cloud.speed_den == slowest]
+        self.near_clouds = [cloud for cloud in clouds if cloud.speed_num / cloud.speed_den > slowest]
+        # The ground covers everything below HEIGHT - BASE_HEIGHT every frame.
+        self.backdrop = pygame.Surface((WIDTH, HEIGHT - BASE_HEIGHT)).convert()
+        self.backdrop_stale = True
+
+    def update(self) -> None:
+        for cloud in self.far_clouds:
+            if cloud.update():
+                self.backdrop_stale = True
+        for cloud in self.near_clouds:
+            cloud.update()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self.backdrop_stale:
+            self.backdrop.fill(BACKGROUND_COLOR)
+            self.backdrop.blits([cloud.render() for cloud in self.far_clouds], doreturn=False)
+            self.backdrop_stale = False
+        surface.blit(self.backdrop, (0, 0))
+        surface.blits([cloud.render() for cloud in self.near_clouds], doreturn=False)
 
 
 def spawn_pipe() -> Pipe:
     margin = 70
-    gap_center = random.randint(margin + PIPE_GAP // 2, HEIGHT - BASE_HEIGHT - margin - PIPE_GAP // 2)
+    gap_center = randint(margin + PIPE_GAP // 2, HEIGHT - BASE_HEIGHT - margin - PIPE_GAP // 2)
     return Pipe(x=WIDTH, gap_y=float(gap_center))
 
 
-def check_collision(bird: Bird, pipes: List[Pipe]) -> bool:
-    if bird.y - BIRD_RADIUS <= 0 or bird.y + BIRD_RADIUS >= HEIGHT - BASE_HEIGHT:
+def ellipse_hits_rect(cx: float, cy: float, half_width: float, half_height: float, rect: pygame.Rect) -> bool:
+    """Exact ellipse/rect overlap using the point of ``rect`` nearest the centre.
+
+    Scaling each axis by the ellipse's half-axis turns it into a unit circle
+    and keeps the rect axis-aligned, so clamping still finds the nearest point.
+    """
+    dx = (cx - min(max(cx, rect.left), rect.right)) / half_width
+    dy = (cy - min(max(cy, rect.top), rect.bottom)) / half_height
+    return dx * dx + dy * dy < 1
+
+
+def check_collision(
+    bird: Bird,
+    pipes: Iterable[Pipe],
+    radius: int = BIRD_RADIUS,
+    half_width: float = BIRD_HALF_WIDTH,
+    half_height: float = BIRD_HALF_HEIGHT,
+    ground_y: int = HEIGHT - BASE_HEIGHT,
+) -> bool:
+    x, y = bird.x, bird.y
+    if y - radius <= 0 or y + radius >= ground_y:
         return True
-    bird_rect = bird.rect()
+    left, right = x - half_width, x + half_width
+    # Broad phase: pipes are ordered left to right, so skip the ones already
+    # behind the bird and stop at the first one entirely ahead of it. Only a
+    # pipe overlapping the bird's x-band reaches the exact tests, which treat
+    # the bird as the ellipse inscribed in its sprite so the corners are clear.
+    # The sprite is drawn untilted, so the axes never need to follow bird.angle.
     for pipe in pipes:
-        if bird_rect.colliderect(pipe.top_rect()) or bird_rect.colliderect(pipe.bottom_rect()):
+        if pipe.top_bounds.right <= left:
+            continue
+        if pipe.top_bounds.left >= right:
+            break
+        if ellipse_hits_rect(x, y, half_width, half_height, pipe.top_bounds) or ellipse_hits_rect(
+            x, y, half_width, half_height, pipe.bottom_bounds
+        ):
             return True
     return False
 
 
-def draw_text(surface: pygame.Surface, text: str, size: int, pos: Tuple[int, int], color=(255, 255, 255), shadow=True) -> None:
-    font = pygame.font.Font(FONT_NAME, size)
-    label = font.render(text, True, color)
-    rect = label.get_rect(center=pos)
+def step(bird: Bird, pipes: Deque[Pipe], base: Base) -> Tuple[int, bool]:
+    """Advance the simulation by one fixed step.
+
+    Moves every entity, spawns and retires pipes and returns the points scored
+    and whether the bird hit anything.
+    """
+    bird.update()
+    for pipe in pipes:
+        pipe.update()
+    base.update()
+
+    # spawn new pipes
+    if pipes[-1].x < WIDTH - 200:
+        pipes.append(spawn_pipe())
+
+    # remove offscreen pipes; they scroll left in spawn order, so only
+    # the head can be offscreen
+    while pipes and pipes[0].is_offscreen():
+        pipes.popleft()
+
+    # scoring; pipes are passed in spawn order, so only the first unscored
+    # one can be the next to score
+    points = 0
+    for pipe in pipes:
+        if not pipe.passed:
+            if pipe.x + PIPE_WIDTH < bird.x:
+                pipe.passed = True
+                points += 1
+            break
+
+    return points, check_collision(bird, pipes)
+
+
+FONTS: Dict[int, pygame.font.Font] = {}
+FONT_SIZES = (48, 24)  # score/title and HUD/prompt sizes
+
+
+def load_fonts() -> None:
+    """Open the HUD font at every size the game draws, ahead of the first frame."""
+    for size in FONT_SIZES:
+        get_font(size)
+
+
+def get_font(size: int) -> pygame.font.Font:
+    font = FONTS.get(size)
+    if font is None:
+        font = FONTS[size] = pygame.font.Font(FONT_NAME, size)
+    return font
+
+
+@functools.lru_cache(maxsize=128)
+def render_text(text: str, size: int, color: Tuple[int, int, int], shadow: bool) -> Tuple[pygame.Surface, int, int]:
+    """Render a label, with its drop shadow composed in, as one surface.
+
+    The surface is premultiplied so that blitting it with BLEND_PREMULTIPLIED
+    matches drawing the shadow and label separately. Returns it with the offset
+    from the label's centre to its top-left corner. Memoised since most text is
+    static.
+    """
+    font = get_font(size)
+    label = font.render(text, True, color).convert_alpha().premul_alpha()
+    half_width, half_height = label.get_width() // 2, label.get_height() // 2
     if shadow:
-        shadow_label = font.render(text, True, (0, 0, 0))
-        shadow_rect = shadow_label.get_rect(center=(pos[0] + 2, pos[1] + 2))
-        surface.blit(shadow_label, shadow_rect)
-    surface.blit(label, rect)
+        shadow_label = font.render(text, True, (0, 0, 0)).convert_alpha().premul_alpha()
+        combined = pygame.Surface((label.get_width() + 2, label.get_height() + 2), pygame.SRCALPHA)
+        combined.blit(shadow_label, (2, 2), special_flags=pygame.BLEND_PREMULTIPLIED)
+        combined.blit(label, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+        label = combined.convert_alpha()
+    return label, half_width, half_height
 
 
-def reset_game() -> Tuple[Bird, List[Pipe], int, Base]:
+def draw_text(surface: pygame.Surface, text: str, size: int, pos: Tuple[int, int], color=(255, 255, 255), shadow=True) -> None:
+    label, half_width, half_height = render_text(text, size, color, shadow)
+    surface.blit(label, (pos[0] - half_width, pos[1] - half_height), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def reset_game() -> Tuple[Bird, Deque[Pipe], int, Base]:
     global bird_index, bird_surface
     bird_index = 0
     bird_surface = bird_frames[bird_index]
-    bird = Bird(x=float(BIRD_X), y=HEIGHT / 2)
-    pipes = [spawn_pipe()]
+    bird = Bird(x=float(BIRD_X), y=HEIGHT / 2, jump_sound=JUMP_SOUND)
+    pipes = deque([spawn_pipe()])
     score = 0
     base = Base(HEIGHT - BASE_HEIGHT)
     return bird, pipes, score, base
@@ -326,18 +509,35 @@ def main() -> None:
     os.environ.setdefault("SDL_VIDEO_CENTERED", "1")
     pygame.display.set_caption("Flappy Bird")
     pygame.time.set_timer(BIRD_FLAP_EVENT, BIRD_FLAP_INTERVAL_MS)
+    # Keep mouse motion, window and other unused events out of the queue entirely.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, BIRD_FLAP_EVENT])
 
     global JUMP_SOUND, HIT_SOUND
     JUMP_SOUND, HIT_SOUND = load_sounds()
+    load_fonts()
 
+    initialize_clouds()
+    sky = Sky(CLOUDS)
     bird, pipes, score, base = reset_game()
     running = True
     game_over = False
     high_score = 0
+    accumulator = 0
+    clock.tick()  # don't count the time spent loading above as play
 
     while running:
-        clock.tick(FPS)
-        for event in pygame.event.get():
+        # Time is consumed in fixed steps so the game runs at the same speed
+        # whatever the frame rate; the cap keeps a long stall (e.g. a dragged
+        # window) from fast-forwarding through seconds of play. clock.tick()
+        # only has millisecond resolution, so the 16 and 17 ms frames of a
+        # 60 FPS loop are snapped to exactly one step rather than left to drift
+        # into frames with no step followed by frames with two.
+        elapsed = clock.tick(FPS) * FPS
+        if abs(elapsed - STEP_TIME) <= STEP_SNAP:
+            elapsed = STEP_TIME
+        accumulator = min(accumulator + elapsed, STEP_TIME * MAX_STEPS_PER_FRAME)
+        while (event := pygame.event.poll()).type != pygame.NOEVENT:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == BIRD_FLAP_EVENT:
@@ -352,41 +552,25 @@ def main() -> None:
                 elif event.key == pygame.K_ESCAPE:
                     running = False
 
-        if not game_over:
-            bird.update()
-            for pipe in pipes:
-                pipe.update()
-            base.update()
-
-            # spawn new pipes
-            if pipes[-1].x < WIDTH - 200:
-                pipes.append(spawn_pipe())
-
-            # remove offscreen pipes
-            pipes = [pipe for pipe in pipes if not pipe.is_offscreen()]
-
-            # scoring
-            for pipe in pipes:
-                if not pipe.passed and pipe.x + PIPE_WIDTH < bird.x:
-                    pipe.passed = True
-                    score += 1
-
-            if bird.alive and check_collision(bird, pipes):
-                if HIT_SOUND:
-                    HIT_SOUND.play()
-                bird.alive = False
-                game_over = True
-                if score > high_score:
-                    high_score = score
+        while accumulator >= STEP_TIME:
+            accumulator -= STEP_TIME
+            sky.update()
+            if not game_over:
+                points, collided = step(bird, pipes, base)
+                score += points
+                if bird.alive and collided:
+                    if HIT_SOUND:
+                        HIT_SOUND.play()
+                    bird.alive = False
+                    game_over = True
+                    if score > high_score:
+                        high_score = score
 
         # Drawing -----------------------------------------------------------------
-        screen.fill(BACKGROUND_COLOR)
-
-        # Draw background clouds
-        draw_clouds(screen)
+        # Sky colour and background clouds
+        sky.draw(screen)
 
-        for pipe in pipes:
-            pipe.draw(screen)
+        draw_pipes(screen, pipes)
 
         base.draw(screen)
         bird.draw(screen)
@@ -404,12 +588,9 @@ def main() -> None:
     sys.exit()
 
 
-def draw_clouds(surface: pygame.Surface) -> None:
-    if not CLOUDS:
-        initialize_clouds()
-    for cloud in CLOUDS:
-        cloud.update()
-        cloud.draw(surface)
+def draw_pipes(surface: pygame.Surface, pipes: Iterable[Pipe]) -> None:
+    # Every pipe's crop blits go to SDL in one batched call.
+    surface.blits([item for pipe in pipes for item in pipe.render()], doreturn=False)
 
 
 if __name__ == "__main__":